@@ -1,20 +1,31 @@
 class Car:
+    __slots__ = ("__wheels", "__engine", "__body", "__str_cache")
+
     def __init__(self):
         self.__wheels = None
         self.__engine = None
         self.__body = None
+        # Built on the first __str__ call, cleared whenever a part changes
+        self.__str_cache = None
 
     def set_wheels(self, wheels):
         self.__wheels = wheels
+        self.__str_cache = None
 
     def set_engine(self, engine):
         self.__engine = engine
+        self.__str_cache = None
 
     def set_body(self, body):
         self.__body = body
+        self.__str_cache = None
 
     def __str__(self):
-        return f"{self.__wheels} wheels, {self.__engine} engine, {self.__body} body"
+        if self.__str_cache is None:
+            self.__str_cache = (
+                f"{self.__wheels} wheels, {self.__engine} engine, {self.__body} body"
+            )
+        return self.__str_cache
 
 
 class Builder:
@@ -27,43 +38,69 @@ class Builder:
     def get_body(self):
         pass
 
+    # All the steps at once, concrete builders can set the parts directly
+    def build_all(self):
+        self.get_wheels()
+        self.get_engine()
+        self.get_body()
+
 
 class Director:
     def __init__(self, builder: Builder):
         self.__builder = builder
 
     def construct_car(self):
-        self.__builder.get_wheels()
-        self.__builder.get_engine()
-        self.__builder.get_body()
+        self.__builder.build_all()
 
 
 class CarBuilder(Builder):
+    # Parts used by both the single steps and build_all
+    WHEELS = "4"
+    ENGINE = "V8"
+    BODY = "Sedan"
+
     def __init__(self):
         self.car = Car()
 
     def get_wheels(self):
-        self.car.set_wheels("4")
+        self.car.set_wheels(self.WHEELS)
 
     def get_engine(self):
-        self.car.set_engine("V8")
+        self.car.set_engine(self.ENGINE)
 
     def get_body(self):
-        self.car.set_body("Sedan")
+        self.car.set_body(self.BODY)
+
+    def build_all(self):
+        car = self.car
+        car.set_wheels(self.WHEELS)
+        car.set_engine(self.ENGINE)
+        car.set_body(self.BODY)
 
 
 class SUVBuilder(Builder):
+    # Parts used by both the single steps and build_all
+    WHEELS = "6"
+    ENGINE = "V6"
+    BODY = "SUV"
+
     def __init__(self):
         self.car = Car()
 
     def get_wheels(self):
-        self.car.set_wheels("6")
+        self.car.set_wheels(self.WHEELS)
 
     def get_engine(self):
-        self.car.set_engine("V6")
+        self.car.set_engine(self.ENGINE)
 
     def get_body(self):
-        self.car.set_body("SUV")
+        self.car.set_body(self.BODY)
+
+    def build_all(self):
+        car = self.car
+        car.set_wheels(self.WHEELS)
+        car.set_engine(self.ENGINE)
+        car.set_body(self.BODY)
 
 
 if __name__ == "__main__":
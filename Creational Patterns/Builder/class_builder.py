@@ -1,30 +1,41 @@
+from dataclasses import dataclass
 
 class Class:
+    __slots__ = ("name", "attributes")
+
     def __init__(self, name: str) -> None:
         self.name = name
         self.attributes = []
 
     def __str__(self):
-        response = f"Class {self.name}:\n"
+        parts = [f"Class {self.name}:\n"]
         if self.attributes:
-            for attribute in self.attributes:
-                response += f"\t{attribute.name} = {attribute.value}\n"
+            parts.extend(
+                f"\t{attribute.name} = {attribute.value}\n"
+                for attribute in self.attributes
+            )
         else:
-            response += f"\tpass"
-        return response
+            parts.append("\tpass")
+        return "".join(parts)
 
+@dataclass(slots=True, frozen=True)
 class Attribute:
-    def __init__(self, name: str, value: str) -> None:
-        self.name = name
-        self.value = value
+    name: str
+    value: str
 
 class ClassBuilder:
     def __init__(self, class_name: str) -> None:
         self.class_obj = Class(class_name)
-    
+
     def add_attribute(self, name: str, value: str):
         self.class_obj.attributes.append(Attribute(name, value))
 
+    def add_attributes(self, *attributes: tuple):
+        # Several (name, value) pairs added in one call
+        self.class_obj.attributes.extend(
+            Attribute(name, value) for name, value in attributes
+        )
+
     def build(self):
         return self.class_obj
 
@@ -37,8 +48,7 @@ class PatermetersClassBuilder(ClassBuilder):
         super().__init__(class_name=class_name)
 
     def build(self):
-        self.add_attribute("nombre", "Jeremias")
-        self.add_attribute("edad", "2000")
+        self.add_attributes(("nombre", "Jeremias"), ("edad", "2000"))
         return super().build()
 
 class Director:
@@ -46,8 +56,7 @@ class Director:
         self.builder = builder
     
     def build_class(self):
-        self.builder.build()
-        return self.builder.class_obj
+        return self.builder.build()
     
 empty_builder = EmptyClassBuilder("EmptyClass")
 empty_director = Director(empty_builder)
@@ -57,4 +66,4 @@ print(empty_class)
 parameter_class_builder = PatermetersClassBuilder("ParameterClass")
 parameter_class_director = Director(parameter_class_builder)
 parameter_class = parameter_class_director.build_class()
-print(parameter_class)
\ No newline at end of file
+print(parameter_class)
@@ -63,10 +63,14 @@ class Client:
     def __init__(self, factory):
         self.button = factory.create_button()
         self.text_box = factory.create_text_box()
+        # The products are fixed once the factory has made them, so bind
+        # their methods here and run() calls them without any lookup
+        self._click = self.button.click
+        self._enter_text = self.text_box.enter_text
 
     def run(self):
-        self.button.click()
-        self.text_box.enter_text("Hello, world!")
+        self._click()
+        self._enter_text("Hello, world!")
 
 
 windows_factory = WindowsFactory()
@@ -53,17 +53,19 @@ class Whisky(AbstractIngredient):
     def __str__(self):
         return f"Whisky {super().__str__()}"
 
+# Built once at import time instead of on every get_ingredient call
+_INGREDIENT_REGISTRY = {
+    "coffee": Coffee,
+    "whisky": Whisky
+}
+
 class IngredientFactory:
     @staticmethod
     def get_ingredient(ingredient: str):
-        ingredients = {
-            "coffee": Coffee,
-            "whisky": Whisky
-        }
-        try:
-            return ingredients[ingredient]
-        except KeyError:
+        ingredient_class = _INGREDIENT_REGISTRY.get(ingredient)
+        if ingredient_class is None:
             raise KeyError(f"{ingredient} is not in the list of valid ingredients")
+        return ingredient_class
 
 # Calling the factory method for coffee
 coffee: Coffee = IngredientFactory.get_ingredient("coffee")("Arabiga", 15)
@@ -28,16 +28,27 @@ class SuperRarePrize(IPrize):
         return "super rare prize >:O"
 
 
+# Built once at import time instead of on every get_prize call
+_PRIZE_REGISTRY = {
+    "common": CommonPrize,
+    "special": SpecialPrize,
+    "rare": RarePrize,
+    "super rare": SuperRarePrize,
+}
+
+# Prizes are stateless, so every draw can share one instance per category
+_PRIZE_INSTANCES = {
+    category: prize_class() for category, prize_class in _PRIZE_REGISTRY.items()
+}
+
+
 class PrizeFactory:
     @staticmethod
     def get_prize(prize_category):
-        factory_methods = {
-            "common": CommonPrize,
-            "special": SpecialPrize,
-            "rare": RarePrize,
-            "super rare": SuperRarePrize,
-        }
-        return factory_methods[prize_category]()
+        prize = _PRIZE_INSTANCES.get(prize_category)
+        if prize is None:
+            raise KeyError(f"{prize_category} is not a valid prize category")
+        return prize
 
 
 if __name__ == "__main__":
@@ -1,36 +1,99 @@
+import asyncio
+import inspect
+import threading
+from weakref import WeakKeyDictionary
+
+
 class DBSingleton:
-    def __init__(self):
-        self.write_client = None
-        self.read_client = None
-
-    def get_write_engine(self):
-        if self.write_client is None:
-            raise ValueError(
-                "Write DB connection not configured. Please configure write DB connection first."
-            )
-        return self.write_client
-
-    def get_read_engine(self):
-        if self.read_client is None:
-            raise ValueError(
-                "Read DB connection not configured. Please configure write DB connection first."
-            )
-        return self.read_client
+    __slots__ = (
+        "write_client",
+        "read_client",
+        "get_write_engine",
+        "get_read_engine",
+        "_engine_locks",
+    )
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __new__(cls):
+        # Double-checked locking, the lock is only taken until the instance exists
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance.write_client = None
+                    instance.read_client = None
+                    instance.get_write_engine = instance._write_engine_not_configured
+                    instance.get_read_engine = instance._read_engine_not_configured
+                    instance._engine_locks = WeakKeyDictionary()
+                    cls._instance = instance
+        return cls._instance
+
+    # get_*_engine point here until the engine is configured, configure_*_engine
+    # replaces the getter with one returning the engine directly
+    def _write_engine_not_configured(self):
+        raise ValueError(
+            "Write DB connection not configured. Please configure write DB connection first."
+        )
+
+    def _read_engine_not_configured(self):
+        raise ValueError(
+            "Read DB connection not configured. Please configure write DB connection first."
+        )
+
+    def _engine_lock(self, engine: str) -> asyncio.Lock:
+        # An asyncio.Lock belongs to the loop that first waits on it, so each
+        # running loop gets its own locks, created the first time they're needed
+        loop = asyncio.get_running_loop()
+        loop_locks = self._engine_locks.get(loop)
+        if loop_locks is None:
+            loop_locks = self._engine_locks[loop] = {
+                "write": asyncio.Lock(),
+                "read": asyncio.Lock(),
+            }
+        return loop_locks[engine]
 
     async def configure_write_engine(self, connection_string: str) -> None:
-        if self.write_client is None:
-            self.write_client = await DBFactory.create_write_engine(connection_string)
+        if self.write_client is not None:
+            return
+        # Overlapping calls wait here and find the engine already created
+        async with self._engine_lock("write"):
+            if self.write_client is None:
+                self.write_client = await DBFactory.create_write_engine(connection_string)
+                write_client = self.write_client
+                self.get_write_engine = lambda: write_client
 
     async def configure_read_engine(self, connection_string: str) -> None:
-        if self.read_client is None:
-            self.read_client = await DBFactory.create_read_engine(connection_string)
+        if self.read_client is not None:
+            return
+        async with self._engine_lock("read"):
+            if self.read_client is None:
+                self.read_client = await DBFactory.create_read_engine(connection_string)
+                read_client = self.read_client
+                self.get_read_engine = lambda: read_client
+
+    async def configure(
+        self, write_connection_string: str, read_connection_string: str
+    ) -> None:
+        # Both engines are independent, so connect them concurrently. Each
+        # configure_*_engine guards itself, so overlapping calls create them once
+        await asyncio.gather(
+            self.configure_write_engine(write_connection_string),
+            self.configure_read_engine(read_connection_string),
+        )
 
-    def close_connection(self) -> None:
+    async def close_connection(self) -> None:
+        # Async drivers return a coroutine from close(), both are awaited together
+        closing = []
         if self.write_client is not None:
-            self.write_client.close()
+            closing.append(self.write_client.close())
             self.write_client = None
+            self.get_write_engine = self._write_engine_not_configured
         if self.read_client is not None:
-            self.read_client.close()
+            closing.append(self.read_client.close())
             self.read_client = None
+            self.get_read_engine = self._read_engine_not_configured
+        await asyncio.gather(*(c for c in closing if inspect.isawaitable(c)))
 
 db_singleton = DBSingleton()
\ No newline at end of file
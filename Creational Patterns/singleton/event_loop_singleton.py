@@ -6,7 +6,10 @@ class EventLoopSingleton:
     def get_event_loop(self):
         if self.event_loop is None:
             self.event_loop = asyncio.new_event_loop()
-        return self.event_loop
+        # From now on the getter only hands back the loop, no None check
+        event_loop = self.event_loop
+        self.get_event_loop = lambda: event_loop
+        return event_loop
     
 event_loop_singleton = EventLoopSingleton()
 loop = event_loop_singleton.get_event_loop()
\ No newline at end of file
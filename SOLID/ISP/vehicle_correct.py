@@ -1,24 +1,39 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
-class Movable(ABC):
-    @abstractmethod
+class Movable(Protocol):
     def go(self):
-        pass
+        ...
 
-# The flyable vehicle can also go, we are adding this functionality
-# to the design of this class
-class Flyable(Movable):
-    @abstractmethod
+# The flyable vehicle can also go, so Flyable builds on Movable
+# instead of repeating go()
+class Flyable(Movable, Protocol):
     def fly(self):
-        pass
+        ...
 
-class Aircraft(Flyable):
+# Vehicles fulfil the interfaces just by having their methods,
+# they don't need to inherit from them
+class Aircraft:
     def go(self):
         print("Taxiing")
 
     def fly(self):
         print("Flying")
 
-class Car(Movable):
+class Car:
     def go(self):
-        print("Going")
\ No newline at end of file
+        print("Going")
+
+# Each function only asks for the interface it needs: anything that can go
+# is enough to drive, but taking off needs something that can also fly
+def drive(vehicle: Movable):
+    vehicle.go()
+
+def take_off(vehicle: Flyable):
+    vehicle.go()
+    vehicle.fly()
+
+if __name__ == '__main__':
+    drive(Car())
+    drive(Aircraft())
+    take_off(Aircraft())
+    # take_off(Car()) is rejected by a type checker: Car is not Flyable
@@ -1,24 +1,28 @@
+import logging
 from abc import ABC, abstractmethod
 
+logger = logging.getLogger(__name__)
+
 class Car(ABC):
+    _GEARS = frozenset(("N", "1", "2", "3", "4", "5", "6", "R"))
+
     @abstractmethod
     def __init__(self, name):
         self.name = name
-        self.gears = ["N", "1", "2", "3", "4", "5", "6", "R"]
         self.speed = 0
         self.gear = "N"
 
     def changeGear(self, gear):
-        if (gear in self.gears):
+        if (gear in Car._GEARS):
             self.gear = gear
-            print("Car %s is in gear %s" % (self.name, self.gear))
+            logger.info("Car %s is in gear %s", self.name, self.gear)
 
     def accelerate(self):
         if (self.gear == "N"):
-            print("Error: Car %s is in gear N" % self.name)
+            logger.error("Error: Car %s is in gear N", self.name)
         else:
             self.speed += 1
-            print("Car %s is accelerating" % self.name)
+            logger.info("Car %s is accelerating", self.name)
 
 class RegularCar(Car):
     def __init__(self, name):
@@ -31,20 +35,22 @@ is making modifications to the original Car, by adding a turbo
 attribute and a method for turbo acceleration
 """
 class SportsCar(Car):
+    _TURBOS = frozenset((2, 3))
+
     def __init__(self, name):
         super().__init__(name)
-        self.turbos = [2, 3]
 
     def turboAccelerate(self, turbo):
         if (self.gear == "N"):
-            print("Error: Car %s is in gear N" % self.name)
+            logger.error("Error: Car %s is in gear N", self.name)
         else:
-            if (turbo in self.turbos):
+            if (turbo in SportsCar._TURBOS):
                 self.speed += turbo
-                print("Car %s is accelerating with turbo %d" % (self.name, turbo))
+                logger.info("Car %s is accelerating with turbo %d", self.name, turbo)
 
 if __name__ == '__main__':
-    
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     car = RegularCar('BMW')
     car.changeGear("1")
     car.accelerate()
@@ -1,43 +1,50 @@
+import logging
+
+logger = logging.getLogger(__name__)
+
 class Car:
+    _GEARS = frozenset(("N", "1", "2", "3", "4", "5", "6", "R"))
+
     def __init__(self, name):
         self.name = name
-        self.gears = ["N", "1", "2", "3", "4", "5", "6", "R"]
         self.speed = 0
         self.gear = "N"
     
     def changeGear(self, gear):
-        if (gear in self.gears):
+        if (gear in Car._GEARS):
             self.gear = gear
-            print(f"Car {self.name} is in gear {self.gear}")
+            logger.info("Car %s is in gear %s", self.name, self.gear)
     
     def accelerate(self):
         if (self.gear == "N"):
-            print(f"Error: Car {self.name} is in gear N")
+            logger.error("Error: Car %s is in gear N", self.name)
         else:
             self.speed += 1
-            print(f"Car {self.name} is accelerating")
+            logger.info("Car %s is accelerating", self.name)
 
 
 # We are making a subclass over a car
 
 class SportsCar(Car):
+    _TURBOS = frozenset((2, 3))
+
     def __init__(self, name):
         super().__init__(name)
-        self.turbos = [2, 3]
     """
     The problem is that we are re implementing the method
     and changing the original parameters.
     """  
     def accelerate(self, turbo):
         if (self.gear == "N"):
-            print("Error: Car %s is in gear N" % self.name)
+            logger.error("Error: Car %s is in gear N", self.name)
         else:
-            if (turbo in self.turbos):
+            if (turbo in SportsCar._TURBOS):
                 self.speed += turbo
-                print("Car %s is accelerating with turbo %d" % (self.name, turbo))
+                logger.info("Car %s is accelerating with turbo %d", self.name, turbo)
 
 if __name__ == '__main__':
-    
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # The original car
     car = Car('BMW')
     car.changeGear("1")
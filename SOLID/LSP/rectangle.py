@@ -1,4 +1,6 @@
 class Rectangle:
+    __slots__ = ('_width', '_height')
+
     def __init__(self, width, height):
         self._height = height
         self._width = width
@@ -28,6 +30,8 @@ class Rectangle:
 
 
 class Square(Rectangle):
+    __slots__ = ()
+
     def __init__(self, size):
         Rectangle.__init__(self, size, size)
 
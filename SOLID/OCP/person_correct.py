@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 
 class Person:
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
@@ -3,6 +3,8 @@ Every time we need to save a person in to a different source, will be need
 to add a new method to the existing storage class
 """
 class Person:
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
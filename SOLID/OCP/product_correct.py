@@ -1,11 +1,29 @@
-from enum import Enum
-
-class Color(Enum):
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import reduce
+
+try:
+    import numpy as np
+except ImportError:
+    # Only needed by the ProductTable / TableFilter example
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Without numba AndSpecification falls back to combining NumPy masks
+    njit = None
+
+# IntEnum so specifications compare plain ints and ProductTable can store
+# the members directly. The tradeoff: members of different enums with the
+# same value are equal (Color.RED == Size.SMALL), so a ColorSpecification
+# given a Size by mistake matches products instead of matching nothing
+class Color(IntEnum):
     RED = 1
     GREEN = 2
     BLUE = 3
 
-class Size(Enum):
+class Size(IntEnum):
     SMALL = 1
     MEDIUM = 2
     LARGE = 3
@@ -13,18 +31,64 @@ class Size(Enum):
 
 class Specification:
     # Empty classes works as interfaces
+    __slots__ = ()
+
     def is_satisfied(self, item):
         pass
 
+    # same condition evaluated over a whole ProductTable at once,
+    # returns a boolean array with one entry per product
+    def mask(self, table):
+        pass
+
+    # (field, value) pairs a ProductTable kernel can check directly,
+    # None when the condition can't be expressed that way
+    def clauses(self):
+        pass
+
     # overload of & operator
     def __and__(self, other):
         return AndSpecification(self, other)
 
+@dataclass(slots=True, frozen=True)
 class Product:
-    def __init__(self, name, color, size):
-        self.name = name
-        self.color = color
-        self.size = size
+    name: str
+    color: Color
+    size: Size
+
+class ProductTable:
+    # Same products stored column by column (one array per attribute)
+    # so a specification can check every product in a single operation
+    COLOR = 0
+    SIZE = 1
+
+    def __init__(self, products):
+        self.products = list(products)
+        self.columns = np.empty((2, len(self.products)), dtype=np.int8)
+        self.columns[self.COLOR] = [p.color for p in self.products]
+        self.columns[self.SIZE] = [p.size for p in self.products]
+        self.colors = self.columns[self.COLOR]
+        self.sizes = self.columns[self.SIZE]
+
+    def __len__(self):
+        return len(self.products)
+
+def _match_all(columns, fields, values, out):
+    # every (field, value) clause checked in one pass over the products,
+    # no intermediate mask per clause
+    for i in range(columns.shape[1]):
+        matched = True
+        for j in range(fields.size):
+            if columns[fields[j], i] != values[j]:
+                matched = False
+                break
+        out[i] = matched
+
+if njit is not None:
+    _match_all = njit(cache=True)(_match_all)
+
+# (fields, values) arrays ready for _match_all, keyed by the clauses
+_CLAUSE_ARRAYS = {}
 
 class Filter:
     # general porpouse filter
@@ -33,27 +97,69 @@ class Filter:
         pass
 
 class ColorSpecification(Specification):
+    __slots__ = ('color',)
+
     def __init__(self, color):
         self.color = color
 
     def is_satisfied(self, item):
         return item.color == self.color
 
+    def mask(self, table):
+        return table.colors == self.color
+
+    def clauses(self):
+        return ((ProductTable.COLOR, self.color),)
+
 class SizeSpecification(Specification):
+    __slots__ = ('size',)
+
     def __init__(self, size):
         self.size = size
 
     def is_satisfied(self, item):
         return item.size == self.size
 
+    def mask(self, table):
+        return table.sizes == self.size
+
+    def clauses(self):
+        return ((ProductTable.SIZE, self.size),)
+
 class AndSpecification(Specification):
     # Combinator: structure that combine other structures
+    __slots__ = ('args',)
+
     def __init__(self, *args):
         self.args = args
 
     def is_satisfied(self, item):
-        return all(map(
-            lambda spec: spec.is_satisfied(item), self.args))
+        for spec in self.args:
+            if not spec.is_satisfied(item):
+                return False
+        return True
+
+    def mask(self, table):
+        clauses = self.clauses()
+        if njit is None or clauses is None:
+            return reduce(np.logical_and, (spec.mask(table) for spec in self.args))
+        arrays = _CLAUSE_ARRAYS.get(clauses)
+        if arrays is None:
+            fields, values = zip(*clauses)
+            arrays = _CLAUSE_ARRAYS[clauses] = (
+                np.array(fields, dtype=np.intp), np.array(values, dtype=np.int8))
+        out = np.empty(len(table), dtype=np.bool_)
+        _match_all(table.columns, arrays[0], arrays[1], out)
+        return out
+
+    def clauses(self):
+        clauses = ()
+        for spec in self.args:
+            spec_clauses = spec.clauses()
+            if spec_clauses is None:
+                return None
+            clauses += spec_clauses
+        return clauses
 
 class BetterFilter(Filter):
     # we are implementing the methods in Filter with out touching 
@@ -63,6 +169,13 @@ class BetterFilter(Filter):
             if spec.is_satisfied(item):
                 yield item
 
+class TableFilter(Filter):
+    # Another Filter for ProductTable: the specification builds one mask
+    # for the whole table instead of being called once per product
+    def filter(self, table, spec):
+        for index in np.flatnonzero(spec.mask(table)):
+            yield table.products[index]
+
 apple = Product('Apple', Color.GREEN, Size.SMALL)
 tree = Product('Tree', Color.GREEN, Size.LARGE)
 house = Product('House', Color.BLUE, Size.LARGE)
@@ -89,3 +202,10 @@ print('Large blue items:')
 large_blue = large & ColorSpecification(Color.BLUE)
 for p in bf.filter(products, large_blue):
     print(f' - {p.name} is large and blue')
+
+if np is not None:
+    print('Large blue items (table filter):')
+    tf = TableFilter()
+    table = ProductTable(products)
+    for p in tf.filter(table, large_blue):
+        print(f' - {p.name} is large and blue')
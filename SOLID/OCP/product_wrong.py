@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from enum import Enum
 
 """
@@ -17,11 +18,11 @@ class Size(Enum):
     LARGE = 3
 
 
+@dataclass(slots=True, frozen=True)
 class Product:
-    def __init__(self, name, color, size):
-        self.name = name
-        self.color = color
-        self.size = size
+    name: str
+    color: Color
+    size: Size
 
 
 class ProductFilter:
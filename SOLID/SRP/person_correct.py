@@ -3,6 +3,8 @@ To make the Person class conforms to the single responsibility principle,
 you'll need to create another class that is in charge of storing the Person to a database
 """
 class Person:
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
@@ -5,6 +5,8 @@ This Person class has two jobs:
 """
 
 class Person:
+    __slots__ = ('name',)
+
     def __init__(self, name):
         self.name = name
 
@@ -1,6 +1,5 @@
 from data import BufferData
-from streaming_device import StreamingDevice
 
-class DroneCamera(StreamingDevice):
+class DroneCamera:
     def get_buffer_data(self) -> BufferData:
         return "###DSLR Camera Buffer Data###"
\ No newline at end of file
@@ -1,8 +1,7 @@
 from typing import Protocol
-from abc import ABC
 
 from data import BufferData
 
-class StreamingDevice(ABC):
+class StreamingDevice(Protocol):
     def get_buffer_data(self) -> BufferData:
         ...
\ No newline at end of file
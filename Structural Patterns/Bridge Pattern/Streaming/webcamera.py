@@ -1,6 +1,5 @@
 from data import BufferData
-from streaming_device import StreamingDevice
 
-class WebCamera(StreamingDevice):
+class WebCamera:
     def get_buffer_data(self) -> BufferData:
         return "###Webcamera buffer data###"
\ No newline at end of file
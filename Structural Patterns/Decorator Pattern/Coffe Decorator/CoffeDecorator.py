@@ -1,31 +1,41 @@
 from abc import ABC
 # Component Interface
 class Coffee(ABC):
+    __slots__ = ()
+
     def cost(self):
         pass
 
 # Concrete Component
 class SimpleCoffee(Coffee):
+    __slots__ = ()
+
     def cost(self):
         return 2
 
 # Decorator
 class CoffeeDecorator(Coffee):
+    __slots__ = ("decorated_coffee", "_cost")
+    # Price each decorator adds on top of the wrapped coffee
+    _delta = 0
+
     def __init__(self, decorated_coffee):
         self.decorated_coffee = decorated_coffee
+        # The wrapped coffee doesn't change, so the whole chain is priced once
+        self._cost = decorated_coffee.cost() + self._delta
 
     def cost(self):
-        return self.decorated_coffee.cost()
+        return self._cost
 
 # Concrete Decorator
 class MilkDecorator(CoffeeDecorator):
-    def cost(self):
-        return self.decorated_coffee.cost() + 1
+    __slots__ = ()
+    _delta = 1
 
 # Concrete Decorator
 class SugarDecorator(CoffeeDecorator):
-    def cost(self):
-        return self.decorated_coffee.cost() + 0.5
+    __slots__ = ()
+    _delta = 0.5
 
 # Usage
 coffee = SimpleCoffee()
@@ -38,23 +38,28 @@ class MultimediaFacade:
         self.audio_player = AudioPlayer()
         self.video_player = VideoPlayer()
         self.image_loader = ImageLoader()
+        # (load, play) and stop methods for each media type, looked up once per call
+        self._play_dispatch = {
+            'audio': (self.audio_player.load_audio, self.audio_player.play_audio),
+            'video': (self.video_player.load_video, self.video_player.play_video),
+            'image': (self.image_loader.load_image, self.image_loader.display_image),
+        }
+        self._stop_dispatch = {
+            'audio': self.audio_player.stop_audio,
+            'video': self.video_player.stop_video,
+        }
 
     def play_media(self, filename, media_type):
-        if media_type == 'audio':
-            self.audio_player.load_audio(filename)
-            self.audio_player.play_audio()
-        elif media_type == 'video':
-            self.video_player.load_video(filename)
-            self.video_player.play_video()
-        elif media_type == 'image':
-            self.image_loader.load_image(filename)
-            self.image_loader.display_image()
+        methods = self._play_dispatch.get(media_type)
+        if methods is not None:
+            load, play = methods
+            load(filename)
+            play()
 
     def stop_media(self, media_type):
-        if media_type == 'audio':
-            self.audio_player.stop_audio()
-        elif media_type == 'video':
-            self.video_player.stop_video()
+        stop = self._stop_dispatch.get(media_type)
+        if stop is not None:
+            stop()
 
 # Usage
 multimedia_player = MultimediaFacade()